@@ -6,20 +6,33 @@ mentioning folks who are oncall.
 """
 
 import argparse
+import bisect
+import concurrent.futures
+import contextlib
 import dataclasses
 import datetime
 import json
 import logging
 import os
+import queue
 import smtplib
+import sys
 import textwrap
+import threading
 import time
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
+from email.message import EmailMessage
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; fall back to the stdlib's (slower) json module.
+    orjson = None  # type: ignore[assignment]
 
 import rotations
 
@@ -30,6 +43,23 @@ GhsaId = str
 SECONDS_BEFORE_ROTATION_LIST_END_TO_NAG = 14 * 24 * 60 * 60
 SECONDS_BETWEEN_ROTATION_REFRESH_EMAILS = 24 * 60 * 60
 
+# Advisory states that we email about.
+UNPUBLISHED_ADVISORY_STATES = ("draft", "triage")
+
+
+def json_dumps_bytes(data: Any) -> bytes:
+    """Serializes `data` as indented, UTF-8 encoded JSON."""
+    if orjson:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def json_loads_bytes(data: bytes) -> Any:
+    """Parses UTF-8 encoded JSON."""
+    if orjson:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 @dataclasses.dataclass(frozen=True)
 class EmailCreds:
@@ -44,16 +74,27 @@ class ScriptState:
     # If the rotation end is coming near, this tracks the last time we alerted about it.
     # Don't want to alert more than once per day.
     last_alert_about_rotation: float | None = None
+    # ETags of the advisory listings (keyed by advisory state) fetched on the
+    # last run. These are only recorded if all advisories in those listings were
+    # handled, so an unchanged listing means there's nothing to do.
+    advisory_list_etags: dict[str, str] = dataclasses.field(default_factory=dict)
 
     @classmethod
     def from_json(cls, json_data: dict[str, Any]) -> "ScriptState":
         return cls(
-            seen_advisories=json_data.get("seen_advisories", []),
+            seen_advisories=[
+                sys.intern(x) for x in json_data.get("seen_advisories", [])
+            ],
             last_alert_about_rotation=json_data.get("last_alert_about_rotation"),
+            advisory_list_etags=json_data.get("advisory_list_etags", {}),
         )
 
     def to_json(self) -> dict[str, Any]:
-        return dataclasses.asdict(self)
+        return {
+            "seen_advisories": list(self.seen_advisories),
+            "last_alert_about_rotation": self.last_alert_about_rotation,
+            "advisory_list_etags": dict(self.advisory_list_etags),
+        }
 
     @classmethod
     def load_from_file(cls, state_file: Path) -> "ScriptState":
@@ -65,9 +106,13 @@ class ScriptState:
 
     def save_to_file(self, state_file: Path) -> None:
         tmp_file = state_file.with_suffix(".tmp")
-        with tmp_file.open("w", encoding="utf-8") as f:
-            json.dump(self.to_json(), f, indent=2, ensure_ascii=False)
-        tmp_file.rename(state_file)
+        with tmp_file.open("wb") as f:
+            f.write(json_dumps_bytes(self.to_json()))
+            # Make sure the data is on disk before the rename, so a crash can't
+            # leave us with an empty or truncated state file.
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, state_file)
 
 
 @dataclasses.dataclass(frozen=True)
@@ -80,16 +125,23 @@ class ScriptEmailInfo:
 @dataclasses.dataclass(frozen=True)
 class ScriptInvocation:
     repo_name: str
-    github_token: str
     now_timestamp: float
     email_info: ScriptEmailInfo | None
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class SecurityAdvisory:
     id: GhsaId
     title: str
-    collaborators: list[str]
+    collaborators: frozenset[str]
+
+
+@dataclasses.dataclass(frozen=True)
+class AdvisoryListing:
+    # All draft/triage advisories, or None if the listings are unchanged since
+    # the ETags passed to `list_unpublished_security_advisories` were recorded.
+    advisories: list[SecurityAdvisory] | None
+    etags: dict[str, str]
 
 
 def extract_next_page_from_header(resp: requests.Response) -> str | None:
@@ -109,157 +161,386 @@ def extract_next_page_from_header(resp: requests.Response) -> str | None:
     return None
 
 
-def requests_get_with_retry(url: str, headers: dict[str, Any]) -> requests.Response:
+def new_github_session(github_token: str) -> requests.Session:
+    """Creates a Session for talking to the GitHub API.
+
+    Connections are kept alive between requests, and transient failures are
+    retried quickly (honoring `Retry-After`) before `requests_get_with_retry`
+    falls back to its much slower retries.
+    """
+    session = requests.Session()
+    session.headers.update(
+        {
+            "Accept": "application/vnd.github+json",
+            "Authorization": f"Bearer {github_token}",
+            "GitHub-Api-Version": "2022-11-28",
+        }
+    )
+    retry = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 502, 503, 504],
+        respect_retry_after_header=True,
+        # Hand the last failed response back, rather than raising.
+        raise_on_status=False,
+    )
+    session.mount(
+        "https://",
+        HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=retry),
+    )
+    return session
+
+
+def seconds_until_rate_limit_reset(resp: requests.Response) -> float | None:
+    """Returns how long to wait for GitHub's rate limit to reset, if `resp` is
+    a rate-limited response."""
+    if resp.headers.get("X-RateLimit-Remaining") != "0":
+        return None
+
+    reset = resp.headers.get("X-RateLimit-Reset")
+    if not reset:
+        return None
+
+    try:
+        reset_timestamp = int(reset)
+    except ValueError:
+        logging.warning("Malformed X-RateLimit-Reset: %s", reset)
+        return None
+    # Add a second of slack, since the reset time is truncated.
+    return max(reset_timestamp - time.time(), 0) + 1
+
+
+def requests_get_with_retry(
+    session: requests.Session,
+    url: str,
+    headers: dict[str, Any] | None = None,
+    cancelled: threading.Event | None = None,
+) -> requests.Response:
+    """GETs `url`, retrying on failure.
+
+    If `cancelled` is set while waiting to retry, this gives up early.
+    """
     i = 0
     max_retries = 3
     while True:
-        resp = requests.get(url, headers=headers)
+        resp = session.get(url, headers=headers)
         if resp.ok:
             return resp
         logging.warning("GETing %s failed: %d %s", url, resp.status_code, resp.text)
         if i >= max_retries:
             resp.raise_for_status()
         i += 1
-        time.sleep(i * 60)
+        rate_limit_wait = seconds_until_rate_limit_reset(resp)
+        if rate_limit_wait is not None:
+            logging.info("Rate limited; sleeping for %d seconds.", rate_limit_wait)
+            retry_wait = rate_limit_wait
+        else:
+            retry_wait = i * 60
+
+        if not cancelled:
+            time.sleep(retry_wait)
+        elif cancelled.wait(retry_wait):
+            resp.raise_for_status()
+
+
+def parse_security_advisory(advisory: dict[str, Any]) -> SecurityAdvisory:
+    """Parses an advisory from GitHub's repository advisory API."""
+    state = advisory["state"]
+    logging.debug("Examining advisory %s state=%s", advisory["ghsa_id"], state)
+    # This should be guaranteed by the `state` filter in our requests.
+    assert state in UNPUBLISHED_ADVISORY_STATES, state
+
+    collaborators = frozenset(
+        x["login"] for x in advisory.get("collaborating_users", ())
+    )
+    return SecurityAdvisory(
+        id=sys.intern(advisory["ghsa_id"]),
+        title=advisory["summary"],
+        collaborators=collaborators,
+    )
 
 
 def fetch_all_security_advisories_of_type(
+    session: requests.Session,
     repo_name: str,
-    github_token: str,
     state: str,
-) -> list[dict[str, Any]]:
-    """Iterates all security advisories for the given repo."""
+    etag: str | None = None,
+    cancelled: threading.Event | None = None,
+) -> tuple[list[SecurityAdvisory] | None, str | None]:
+    """Iterates all security advisories for the given repo.
+
+    Returns the advisories and the listing's ETag. If `etag` is given and the
+    listing hasn't changed, the advisories are None. ETags are only returned
+    for single-page listings, since later pages can change without the first
+    one changing.
+    """
     # Uses the API here:
     # https://docs.github.com/en/rest/security-advisories/repository-advisories?apiVersion=2022-11-28#list-repository-security-advisories
+    #
+    # Repository (i.e., draft/triage) advisories aren't exposed through the
+    # GraphQL API, so this can't be narrowed to just the fields we need. Ask for
+    # the largest page size the API allows, so we usually need one request.
     url: str | None = (
-        f"https://api.github.com/repos/{repo_name}/security-advisories?state={state}"
+        f"https://api.github.com/repos/{repo_name}/security-advisories"
+        f"?state={state}&per_page=100"
     )
-    request_headers = {
-        "Accept": "application/vnd.github+json",
-        "Authorization": f"Bearer {github_token}",
-        "GitHub-Api-Version": "2022-11-28",
-    }
+    first_page_headers = None
+    if etag:
+        # Unchanged listings get a 304, which doesn't count against our rate
+        # limit.
+        first_page_headers = {"If-None-Match": etag}
+
     results = []
+    new_etag = None
+    is_first_page = True
     while url:
         resp = requests_get_with_retry(
+            session,
             url,
-            headers=request_headers,
+            headers=first_page_headers if is_first_page else None,
+            cancelled=cancelled,
         )
+        if resp.status_code == 304:
+            return None, etag
 
-        results += resp.json()
         url = extract_next_page_from_header(resp)
+        if is_first_page and not url:
+            new_etag = resp.headers.get("ETag")
+        is_first_page = False
+
+        # Parse the raw bytes directly, rather than having `requests` guess
+        # the encoding and decode to a str first. Only what we need from each
+        # advisory is kept, so full pages don't pile up in memory.
+        results += [parse_security_advisory(x) for x in json_loads_bytes(resp.content)]
 
-    return results
+    return results, new_etag
 
 
 def list_unpublished_security_advisories(
-    repo_name: str, github_token: str
-) -> list[SecurityAdvisory]:
-    results = []
-    total_security_advisories = 0
-    advisories = fetch_all_security_advisories_of_type(repo_name, github_token, "draft")
-    advisories += fetch_all_security_advisories_of_type(
-        repo_name, github_token, "triage"
-    )
-    for advisory in advisories:
-        logging.debug("Examining advisory %s", advisory)
-
-        total_security_advisories += 1
-        state = advisory["state"]
-        # This should be guaranteed by the
-        # 'fetch_all_security_advisories_of_type' function.
-        assert state in ("draft", "triage"), state
-
-        collaborators = [x["login"] for x in advisory.get("collaborating_users", ())]
-        results.append(
-            SecurityAdvisory(
-                id=advisory["ghsa_id"],
-                title=advisory["summary"],
-                collaborators=collaborators,
+    session: requests.Session,
+    repo_name: str,
+    etags: dict[str, str],
+    cancelled: threading.Event | None = None,
+) -> AdvisoryListing:
+    # Each listing is a separate round trip (or several), so fetch them
+    # concurrently.
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=len(UNPUBLISHED_ADVISORY_STATES)
+    ) as executor:
+        listing_futures = {
+            state: executor.submit(
+                fetch_all_security_advisories_of_type,
+                session,
+                repo_name,
+                state,
+                etags.get(state),
+                cancelled=cancelled,
             )
-        )
+            for state in UNPUBLISHED_ADVISORY_STATES
+        }
+
+    listings = {}
+    new_etags = {}
+    for state, future in listing_futures.items():
+        listings[state], etag = future.result()
+        if etag:
+            new_etags[state] = etag
+
+    if all(x is None for x in listings.values()):
+        return AdvisoryListing(advisories=None, etags=new_etags)
+
+    advisories = []
+    for state, listing in listings.items():
+        if listing is None:
+            # Only some listings changed; the unchanged ones need to be fetched
+            # in full, too.
+            listing, _ = fetch_all_security_advisories_of_type(
+                session, repo_name, state, cancelled=cancelled
+            )
+            assert listing is not None
+        advisories += listing
 
-    results.sort(key=lambda x: x.id)
-    logging.info("Total security advisories fetched: %d", total_security_advisories)
-    logging.info("%d draft security advisories found.", len(results))
-    return results
+    advisories.sort(key=lambda x: x.id)
+    logging.info("%d draft security advisories found.", len(advisories))
+    return AdvisoryListing(advisories=advisories, etags=new_etags)
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class RotationState:
     all_members: set[str]
     current_members: set[str]
     final_rotation_start: float
+    # Derived from `current_members`.
+    sorted_current_members: tuple[str, ...] = dataclasses.field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self, "sorted_current_members", tuple(sorted(self.current_members))
+        )
 
 
 def load_rotation_state(now_timestamp: float) -> RotationState | None:
-    rotation_members_file = rotations.RotationMembersFile.parse_file(
+    rotation_members_file = rotations.load_cached(
+        rotations.RotationMembersFile,
         rotations.ROTATION_MEMBERS_FILE,
     )
-    rotation_file = rotations.RotationFile.parse_file(
+    rotation_file = rotations.load_cached(
+        rotations.RotationFile,
         rotations.ROTATION_FILE,
     )
 
-    current_rotation = None
-    # Pick the most recent rotation with a timstamp <= now
-    for rotation in rotation_file.rotations:
-        if rotation.start_time.timestamp() > now_timestamp:
-            break
-        current_rotation = rotation
-
-    if not current_rotation:
+    # Pick the most recent rotation with a timestamp <= now. `rotations` is
+    # sorted by start time, so this can bisect.
+    current_rotation_index = (
+        bisect.bisect_right(
+            rotation_file.rotations,
+            now_timestamp,
+            key=lambda x: x.start_timestamp,
+        )
+        - 1
+    )
+    if current_rotation_index < 0:
         return None
 
+    current_rotation = rotation_file.rotations[current_rotation_index]
     return RotationState(
         all_members=set(rotation_members_file.members),
         current_members=set(current_rotation.members),
-        final_rotation_start=rotation_file.rotations[-1].start_time.timestamp(),
+        final_rotation_start=rotation_file.rotations[-1].start_timestamp,
     )
 
 
-def try_email_llvm_security_team(
-    email_creds: EmailCreds,
-    email_recipient: str,
-    subject: str,
-    body: str,
-) -> bool:
-    """Returns True if the email was sent successfully."""
-    try:
-        # Create a multipart message
-        message = MIMEMultipart()
-        message["From"] = email_creds.username
-        message["To"] = email_recipient
-        message["Subject"] = subject
-        # Add body to email
-        message.attach(MIMEText(body, "plain"))
+class SmtpSession:
+    """An SMTP connection shared by all emails sent during a run of this script.
+
+    The connection is opened lazily on the first send, and reopened if the
+    server drops it between sends.
+    """
 
-        with smtplib.SMTP("smtp.gmail.com", 587) as server:
+    def __init__(self, email_info: ScriptEmailInfo) -> None:
+        self.email_info = email_info
+        self._server: smtplib.SMTP | None = None
+
+    def _connect(self) -> smtplib.SMTP:
+        server = smtplib.SMTP("smtp.gmail.com", 587)
+        try:
             server.ehlo()
             server.starttls()
             server.ehlo()
 
-            server.login(email_creds.username, email_creds.password)
+            creds = self.email_info.creds
+            server.login(creds.username, creds.password)
+        except Exception:
+            server.close()
+            raise
+        return server
+
+    def send_one(self, subject: str, body: str) -> None:
+        """Sends an email. Raises on failure."""
+        message = EmailMessage()
+        message["From"] = self.email_info.creds.username
+        message["To"] = self.email_info.recipient
+        message["Subject"] = subject
+        message.set_content(body)
 
-            server.sendmail(email_creds.username, email_recipient, message.as_string())
+        if self._server is None:
+            self._server = self._connect()
 
-        logging.info("Email sent successfully to %s", email_recipient)
-        return True
-    except Exception as e:
+        try:
+            self._server.send_message(message)
+        except smtplib.SMTPServerDisconnected:
+            logging.warning("SMTP server disconnected; reconnecting.")
+            self._server.close()
+            # Clear this first, so a failed reconnect gets retried on the next
+            # send.
+            self._server = None
+            self._server = self._connect()
+            self._server.send_message(message)
+
+    def close(self) -> None:
+        server, self._server = self._server, None
+        if server is None:
+            return
+
+        try:
+            server.quit()
+        except smtplib.SMTPServerDisconnected:
+            pass
+        finally:
+            server.close()
+
+
+class SmtpPool:
+    """A pool of up to `size` SmtpSessions, so multiple emails can be sent at
+    once."""
+
+    def __init__(self, email_info: ScriptEmailInfo, size: int) -> None:
+        self.email_info = email_info
+        self.size = size
+        # Sessions connect lazily, so only as many connections as are
+        # concurrently needed get opened.
+        self._sessions = [SmtpSession(email_info) for _ in range(size)]
+        self._idle_sessions: queue.Queue[SmtpSession] = queue.Queue()
+        for session in self._sessions:
+            self._idle_sessions.put(session)
+
+    def send_one(self, subject: str, body: str) -> None:
+        """Sends an email using an idle session. Raises on failure."""
+        session = self._idle_sessions.get()
+        try:
+            session.send_one(subject, body)
+        finally:
+            self._idle_sessions.put(session)
+
+    def close(self) -> None:
+        for session in self._sessions:
+            session.close()
+
+
+@contextlib.contextmanager
+def open_smtp_pool(
+    email_info: ScriptEmailInfo | None,
+    size: int,
+) -> Iterator[SmtpPool | None]:
+    """Yields an SmtpPool, or None if `email_info` is None (dry-run)."""
+    if not email_info:
+        yield None
+        return
+
+    pool = SmtpPool(email_info, size)
+    try:
+        yield pool
+    finally:
+        pool.close()
+
+
+def try_email_llvm_security_team(
+    smtp_pool: SmtpPool,
+    subject: str,
+    body: str,
+) -> bool:
+    """Returns True if the email was sent successfully."""
+    try:
+        smtp_pool.send_one(subject, body)
+    except Exception:
         logging.exception("Failed to send email with subject '%s'", subject)
         return False
 
+    logging.info("Email sent successfully to %s", smtp_pool.email_info.recipient)
+    return True
+
 
 def email_about_advisory(
-    email_creds: EmailCreds,
-    email_recipient: str,
+    smtp_pool: SmtpPool,
     repo_name: str,
     advisory: SecurityAdvisory,
-    oncall_members: list[str],
+    oncall_members: tuple[str, ...],
 ) -> bool:
     """Sends an email; returns True if successful."""
     return try_email_llvm_security_team(
-        email_creds=email_creds,
-        email_recipient=email_recipient,
+        smtp_pool=smtp_pool,
         subject=f"New security advisory for {repo_name}: {advisory.title}",
         body=textwrap.dedent(
             f"""\
@@ -278,6 +559,7 @@ def maybe_email_about_rotation_end(
     invocation: ScriptInvocation,
     state: ScriptState,
     rotation_state: RotationState | None,
+    smtp_pool: SmtpPool | None,
 ) -> ScriptState:
     if rotation_state:
         time_to_last_start = (
@@ -306,8 +588,7 @@ def maybe_email_about_rotation_end(
         last_alert_about_rotation=invocation.now_timestamp,
     )
 
-    email_info = invocation.email_info
-    if not email_info:
+    if not smtp_pool:
         logging.info(
             "dry-run: would send email about rotation end for %s",
             invocation.repo_name,
@@ -315,17 +596,17 @@ def maybe_email_about_rotation_end(
         return new_state
 
     if rotation_state:
-        pretty_last_rotation_start = time.strftime(
-            "%Y-%m-%d %H:%M:%S %Z",
-            time.localtime(rotation_state.final_rotation_start),
-        )
+        # Rotations start at midnight UTC, so UTC is the clearest timezone to
+        # report this in.
+        pretty_last_rotation_start = datetime.datetime.fromtimestamp(
+            rotation_state.final_rotation_start, tz=datetime.timezone.utc
+        ).strftime("%Y-%m-%d %H:%M:%S %Z")
         issue = f"the last rotation starts at {pretty_last_rotation_start}"
     else:
         issue = "no rotation is currently scheduled"
 
     email_ok = try_email_llvm_security_team(
-        email_creds=email_info.creds,
-        email_recipient=email_info.recipient,
+        smtp_pool=smtp_pool,
         subject=f"Rotation schedule running short for {invocation.repo_name}",
         body=textwrap.dedent(
             f"""\
@@ -350,64 +631,80 @@ def run_script(
     invocation: ScriptInvocation,
     script_state: ScriptState,
     rotation_state: RotationState,
+    advisory_listing: AdvisoryListing,
+    smtp_pool: SmtpPool | None,
 ) -> ScriptState:
-    draft_security_advisories = list_unpublished_security_advisories(
-        invocation.repo_name,
-        invocation.github_token,
-    )
+    draft_security_advisories = advisory_listing.advisories
+    if draft_security_advisories is None:
+        logging.info("No advisories have changed since the last run.")
+        return script_state
 
-    failed_alerts_for_advisories = set()
-    current_oncall = sorted(rotation_state.current_members)
+    seen_advisories = frozenset(script_state.seen_advisories)
+    advisories_to_email = []
     for advisory in draft_security_advisories:
-        has_rotation_member = any(
-            member in rotation_state.current_members
-            for member in advisory.collaborators
-        )
-
-        if advisory.id in script_state.seen_advisories:
+        if advisory.id in seen_advisories:
             logging.info(
                 "Skipping advisory %s: already seen/alerted.",
                 advisory.id,
             )
             continue
 
-        if has_rotation_member:
+        if not rotation_state.current_members.isdisjoint(advisory.collaborators):
             logging.info(
                 "Skipping advisory %s: already has rotation member(s) as collaborator.",
                 advisory.id,
             )
             continue
 
-        email_info = invocation.email_info
-        if not email_info:
+        advisories_to_email.append(advisory)
+
+    failed_alerts_for_advisories = set()
+    if not advisories_to_email:
+        logging.info("No new advisories to email about.")
+    elif not smtp_pool:
+        for advisory in advisories_to_email:
             logging.info(
                 "dry-run: would send email about advisory %s, mentioning %s",
                 advisory.id,
-                current_oncall,
+                rotation_state.sorted_current_members,
             )
-            continue
-
-        email_success = email_about_advisory(
-            email_creds=email_info.creds,
-            email_recipient=email_info.recipient,
-            repo_name=invocation.repo_name,
-            advisory=advisory,
-            oncall_members=current_oncall,
-        )
-
-        if not email_success:
-            failed_alerts_for_advisories.add(advisory.id)
-
+    else:
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=smtp_pool.size
+        ) as executor:
+            email_futures = {
+                executor.submit(
+                    email_about_advisory,
+                    smtp_pool=smtp_pool,
+                    repo_name=invocation.repo_name,
+                    advisory=advisory,
+                    oncall_members=rotation_state.sorted_current_members,
+                ): advisory
+                for advisory in advisories_to_email
+            }
+            for future in concurrent.futures.as_completed(email_futures):
+                if not future.result():
+                    failed_alerts_for_advisories.add(email_futures[future].id)
+
+    new_seen_advisories = [
+        x.id
+        # You can't unpublish advisories, so no need to keep ones
+        # exclusively in the old state around.
+        for x in draft_security_advisories
+        # Pretend we didn't see advisories we failed to alert about, so we
+        # try again next time.
+        if x.id not in failed_alerts_for_advisories
+    ]
+    # `draft_security_advisories` is already sorted by ID, so this is a
+    # linear-time check in practice.
+    new_seen_advisories.sort()
     return dataclasses.replace(
         script_state,
-        seen_advisories=sorted(
-            x.id
-            # You can't unpublish advisories, so no need to keep ones
-            # exclusively in the old state around.
-            for x in draft_security_advisories
-            # Pretend we didn't see advisories we failed to alert about, so we
-            # try again next time.
-            if x.id not in failed_alerts_for_advisories
+        seen_advisories=new_seen_advisories,
+        # If any alerts failed, the listings need to be fully fetched next time,
+        # so those alerts get retried.
+        advisory_list_etags=(
+            {} if failed_alerts_for_advisories else advisory_listing.etags
         ),
     )
 
@@ -452,6 +749,15 @@ def parse_args() -> argparse.Namespace:
         default=os.getenv("GMAIL_PASSWORD"),
         help="Email (Gmail) password. Defaults to GMAIL_PASSWORD env var.",
     )
+    parser.add_argument(
+        "--smtp-pool-size",
+        type=int,
+        default=1,
+        help="""
+        Maximum number of SMTP connections to send emails over concurrently.
+        Default is %(default)d.
+        """,
+    )
     parser.add_argument(
         "--email-recipient",
         default=os.getenv("EMAIL_RECIPIENT"),
@@ -469,6 +775,9 @@ def parse_args() -> argparse.Namespace:
             "GitHub token must be specified either via --github-token or GITHUB_TOKEN env var."
         )
 
+    if args.smtp_pool_size < 1:
+        parser.error("--smtp-pool-size must be at least 1.")
+
     if not args.dry_run:
         if not args.email_username:
             parser.error(
@@ -486,6 +795,16 @@ def parse_args() -> argparse.Namespace:
     return args
 
 
+def log_abandoned_listing_failure(
+    future: concurrent.futures.Future[AdvisoryListing],
+) -> None:
+    if not future.cancelled() and future.exception():
+        logging.warning(
+            "Listing advisories failed, though the listing wasn't needed: %s",
+            future.exception(),
+        )
+
+
 def main() -> None:
     opts = parse_args()
 
@@ -497,6 +816,7 @@ def main() -> None:
     now = time.time()
     state_file: Path = opts.state_file
     dry_run: bool = opts.dry_run
+    smtp_pool_size: int = opts.smtp_pool_size
     email_info = None
     if not dry_run:
         email_info = ScriptEmailInfo(
@@ -507,32 +827,64 @@ def main() -> None:
         )
 
     script_state = ScriptState.load_from_file(state_file)
-    rotation_state = load_rotation_state(now)
+    github_session = new_github_session(opts.github_token)
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+    advisory_listing_cancelled = threading.Event()
+    # Listing advisories is bound by network latency, so start it before
+    # reading rotation files rather than after.
+    advisories_future = executor.submit(
+        list_unpublished_security_advisories,
+        github_session,
+        opts.github_repo,
+        script_state.advisory_list_etags,
+        cancelled=advisory_listing_cancelled,
+    )
+    # The session is only needed until the listing is done.
+    advisories_future.add_done_callback(lambda _: github_session.close())
+    try:
+        rotation_state = load_rotation_state(now)
+    except BaseException:
+        advisory_listing_cancelled.set()
+        executor.shutdown(wait=False, cancel_futures=True)
+        raise
+    finally:
+        executor.shutdown(wait=False)
+
+    if not rotation_state:
+        # The listing isn't needed, so don't wait for it (or its retries), and
+        # don't let a failure in it fail the script.
+        advisory_listing_cancelled.set()
+        executor.shutdown(wait=False, cancel_futures=True)
+        advisories_future.add_done_callback(log_abandoned_listing_failure)
+
     script_invocation = ScriptInvocation(
         repo_name=opts.github_repo,
-        github_token=opts.github_token,
         now_timestamp=now,
         email_info=email_info,
     )
 
-    if rotation_state:
-        new_script_state = run_script(
-            invocation=script_invocation,
-            script_state=script_state,
-            rotation_state=rotation_state,
-        )
-    else:
-        new_script_state = script_state
-        logging.warning(
-            "No rotation state found; not sending any emails about security advisories."
-        )
+    with open_smtp_pool(email_info, smtp_pool_size) as smtp_pool:
+        if rotation_state:
+            new_script_state = run_script(
+                invocation=script_invocation,
+                script_state=script_state,
+                rotation_state=rotation_state,
+                advisory_listing=advisories_future.result(),
+                smtp_pool=smtp_pool,
+            )
+        else:
+            new_script_state = script_state
+            logging.warning(
+                "No rotation state found; not sending any emails about security advisories."
+            )
 
-    if rotation_state:
-        new_script_state = maybe_email_about_rotation_end(
-            invocation=script_invocation,
-            state=new_script_state,
-            rotation_state=rotation_state,
-        )
+        if rotation_state:
+            new_script_state = maybe_email_about_rotation_end(
+                invocation=script_invocation,
+                state=new_script_state,
+                rotation_state=rotation_state,
+                smtp_pool=smtp_pool,
+            )
 
     if new_script_state == script_state:
         return
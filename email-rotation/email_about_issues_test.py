@@ -1,9 +1,16 @@
 #!/usr/bin/env python3
 
 import datetime
+import smtplib
+import tempfile
+import threading
+import time
 import unittest
+from pathlib import Path
 from unittest import mock
 
+import requests
+
 import email_about_issues as email
 import rotations
 
@@ -18,6 +25,9 @@ TEST_EMAIL_INFO = email.ScriptEmailInfo(
 
 
 class TestEmailAboutIssues(unittest.TestCase):
+    def setUp(self) -> None:
+        rotations.clear_parse_cache()
+
     @mock.patch.object(rotations.RotationMembersFile, "parse_file")
     @mock.patch.object(rotations.RotationFile, "parse_file")
     def test_load_rotation_state_returns_expected(
@@ -56,7 +66,6 @@ class TestEmailAboutIssues(unittest.TestCase):
     ) -> None:
         invocation = email.ScriptInvocation(
             repo_name="repo",
-            github_token="token",
             now_timestamp=2000.0,
             email_info=TEST_EMAIL_INFO,
         )
@@ -70,7 +79,7 @@ class TestEmailAboutIssues(unittest.TestCase):
         )
         mock_send_email.return_value = True
         new_state = email.maybe_email_about_rotation_end(
-            invocation, state, rotation_state
+            invocation, state, rotation_state, email.SmtpPool(TEST_EMAIL_INFO, size=1)
         )
         mock_send_email.assert_called_once()
         self.assertNotEqual(new_state, state)
@@ -82,7 +91,6 @@ class TestEmailAboutIssues(unittest.TestCase):
     ) -> None:
         invocation = email.ScriptInvocation(
             repo_name="repo",
-            github_token="token",
             now_timestamp=2000.0,
             email_info=TEST_EMAIL_INFO,
         )
@@ -96,7 +104,7 @@ class TestEmailAboutIssues(unittest.TestCase):
         )
         mock_send_email.return_value = True
         new_state = email.maybe_email_about_rotation_end(
-            invocation, state, rotation_state
+            invocation, state, rotation_state, email.SmtpPool(TEST_EMAIL_INFO, size=1)
         )
         mock_send_email.assert_not_called()
         self.assertEqual(new_state, state)
@@ -107,7 +115,6 @@ class TestEmailAboutIssues(unittest.TestCase):
     ) -> None:
         invocation = email.ScriptInvocation(
             repo_name="repo",
-            github_token="token",
             now_timestamp=2000.0,
             email_info=TEST_EMAIL_INFO,
         )
@@ -121,15 +128,229 @@ class TestEmailAboutIssues(unittest.TestCase):
         )
         mock_send_email.return_value = True
         new_state = email.maybe_email_about_rotation_end(
-            invocation, state, rotation_state
+            invocation, state, rotation_state, email.SmtpPool(TEST_EMAIL_INFO, size=1)
         )
         mock_send_email.assert_not_called()
         self.assertEqual(new_state, state)
 
-    def test_scriptstate_json_roundtrip(self) -> None:
+    @mock.patch.object(email, "email_about_advisory")
+    def test_run_script_emails_about_new_advisories(
+        self, mock_email_about_advisory: mock.Mock
+    ) -> None:
+        advisories = [
+            email.SecurityAdvisory(
+                id="GHSA-1", title="seen", collaborators=frozenset()
+            ),
+            email.SecurityAdvisory(
+                id="GHSA-2", title="oncall", collaborators=frozenset({"a"})
+            ),
+            email.SecurityAdvisory(
+                id="GHSA-3", title="new", collaborators=frozenset({"b"})
+            ),
+            email.SecurityAdvisory(
+                id="GHSA-4", title="fails", collaborators=frozenset()
+            ),
+        ]
+        mock_email_about_advisory.side_effect = (
+            lambda advisory, **kwargs: advisory.id != "GHSA-4"
+        )
+        invocation = email.ScriptInvocation(
+            repo_name="repo",
+            now_timestamp=2000.0,
+            email_info=TEST_EMAIL_INFO,
+        )
+        state = email.ScriptState(seen_advisories=["GHSA-0", "GHSA-1"])
+        rotation_state = email.RotationState(
+            all_members={"a", "b"},
+            current_members={"a"},
+            final_rotation_start=3000.0,
+        )
+        new_state = email.run_script(
+            invocation,
+            state,
+            rotation_state,
+            email.AdvisoryListing(advisories=advisories, etags={"draft": '"etag"'}),
+            email.SmtpPool(TEST_EMAIL_INFO, size=2),
+        )
+        emailed = sorted(
+            call.kwargs["advisory"].id
+            for call in mock_email_about_advisory.call_args_list
+        )
+        self.assertEqual(emailed, ["GHSA-3", "GHSA-4"])
+        self.assertEqual(new_state.seen_advisories, ["GHSA-1", "GHSA-2", "GHSA-3"])
+        # GHSA-4 failed, so the listing must be refetched in full next time.
+        self.assertEqual(new_state.advisory_list_etags, {})
+
+    @mock.patch.object(email, "email_about_advisory")
+    def test_run_script_does_nothing_for_unchanged_advisories(
+        self, mock_email_about_advisory: mock.Mock
+    ) -> None:
+        invocation = email.ScriptInvocation(
+            repo_name="repo",
+            now_timestamp=2000.0,
+            email_info=TEST_EMAIL_INFO,
+        )
+        state = email.ScriptState(
+            seen_advisories=["GHSA-1"],
+            advisory_list_etags={"draft": '"etag"'},
+        )
+        rotation_state = email.RotationState(
+            all_members={"a", "b"},
+            current_members={"a"},
+            final_rotation_start=3000.0,
+        )
+        new_state = email.run_script(
+            invocation,
+            state,
+            rotation_state,
+            email.AdvisoryListing(advisories=None, etags={"draft": '"etag"'}),
+            email.SmtpPool(TEST_EMAIL_INFO, size=1),
+        )
+        mock_email_about_advisory.assert_not_called()
+        self.assertEqual(new_state, state)
+
+    @mock.patch.object(smtplib, "SMTP")
+    def test_smtp_session_reuses_and_reopens_connection(
+        self, mock_smtp: mock.Mock
+    ) -> None:
+        first_server = mock.Mock()
+        second_server = mock.Mock()
+        mock_smtp.side_effect = [first_server, second_server]
+
+        with email.open_smtp_pool(TEST_EMAIL_INFO, size=1) as smtp_pool:
+            assert smtp_pool
+            smtp_pool.send_one("subject 1", "body 1")
+            smtp_pool.send_one("subject 2", "body 2")
+            self.assertEqual(mock_smtp.call_count, 1)
+            self.assertEqual(first_server.send_message.call_count, 2)
+
+            first_server.send_message.side_effect = smtplib.SMTPServerDisconnected()
+            smtp_pool.send_one("subject 3", "body 3")
+            self.assertEqual(mock_smtp.call_count, 2)
+            second_server.login.assert_called_once()
+            second_server.send_message.assert_called_once()
+
+        second_server.quit.assert_called_once()
+
+    @mock.patch.object(email, "fetch_all_security_advisories_of_type")
+    def test_list_unpublished_security_advisories(self, mock_fetch: mock.Mock) -> None:
+        def fetch(
+            session: requests.Session,
+            repo_name: str,
+            state: str,
+            etag: str | None = None,
+            cancelled: threading.Event | None = None,
+        ) -> tuple[list[email.SecurityAdvisory] | None, str | None]:
+            if state == "draft" and etag:
+                return None, etag
+            advisory = email.SecurityAdvisory(
+                id=f"GHSA-{state}", title=state, collaborators=frozenset()
+            )
+            return [advisory], f'"{state}"'
+
+        mock_fetch.side_effect = fetch
+        listing = email.list_unpublished_security_advisories(
+            requests.Session(), "repo", etags={}
+        )
+        assert listing.advisories is not None
+        self.assertEqual(
+            [x.id for x in listing.advisories], ["GHSA-draft", "GHSA-triage"]
+        )
+        self.assertEqual(listing.etags, {"draft": '"draft"', "triage": '"triage"'})
+
+        # If only some listings are unchanged, those get refetched in full.
+        listing = email.list_unpublished_security_advisories(
+            requests.Session(), "repo", etags={"draft": '"draft"'}
+        )
+        assert listing.advisories is not None
+        self.assertEqual(
+            [x.id for x in listing.advisories], ["GHSA-draft", "GHSA-triage"]
+        )
+
+    @mock.patch.object(email, "requests_get_with_retry")
+    def test_fetch_advisories_uses_etags(self, mock_get: mock.Mock) -> None:
+        ok_resp = requests.Response()
+        ok_resp.status_code = 200
+        ok_resp.headers["ETag"] = '"new"'
+        ok_resp._content = b"""[{
+            "ghsa_id": "GHSA-1",
+            "state": "draft",
+            "summary": "title",
+            "collaborating_users": [{"login": "a"}]
+        }]"""
+        mock_get.return_value = ok_resp
+        advisories, etag = email.fetch_all_security_advisories_of_type(
+            requests.Session(), "repo", "draft", etag='"old"'
+        )
+        self.assertEqual(
+            advisories,
+            [
+                email.SecurityAdvisory(
+                    id="GHSA-1", title="title", collaborators=frozenset({"a"})
+                )
+            ],
+        )
+        self.assertEqual(etag, '"new"')
+        self.assertEqual(mock_get.call_args.kwargs["headers"]["If-None-Match"], '"old"')
+
+        not_modified_resp = requests.Response()
+        not_modified_resp.status_code = 304
+        mock_get.return_value = not_modified_resp
+        advisories, etag = email.fetch_all_security_advisories_of_type(
+            requests.Session(), "repo", "draft", etag='"new"'
+        )
+        self.assertIsNone(advisories)
+        self.assertEqual(etag, '"new"')
+
+    @mock.patch.object(time, "sleep")
+    def test_requests_get_with_retry_gives_up_when_cancelled(
+        self, mock_sleep: mock.Mock
+    ) -> None:
+        failed_resp = requests.Response()
+        failed_resp.status_code = 500
+        failed_resp._content = b""
+        session = mock.Mock()
+        session.get.return_value = failed_resp
+        cancelled = threading.Event()
+        cancelled.set()
+        with self.assertRaises(requests.HTTPError):
+            email.requests_get_with_retry(session, "url", cancelled=cancelled)
+        session.get.assert_called_once()
+        mock_sleep.assert_not_called()
+
+    @mock.patch.object(time, "time")
+    def test_seconds_until_rate_limit_reset(self, mock_time: mock.Mock) -> None:
+        mock_time.return_value = 1000.0
+        resp = requests.Response()
+        self.assertIsNone(email.seconds_until_rate_limit_reset(resp))
+
+        resp.headers["X-RateLimit-Remaining"] = "0"
+        resp.headers["X-RateLimit-Reset"] = "1030"
+        self.assertEqual(email.seconds_until_rate_limit_reset(resp), 31.0)
+
+        resp.headers["X-RateLimit-Remaining"] = "12"
+        self.assertIsNone(email.seconds_until_rate_limit_reset(resp))
+
+    def test_scriptstate_file_roundtrip(self) -> None:
         original = email.ScriptState(
             seen_advisories=["a", "b"], last_alert_about_rotation=123.45
         )
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            state_file = Path(tmp_dir) / "state.json"
+            original.save_to_file(state_file)
+            self.assertEqual(email.ScriptState.load_from_file(state_file), original)
+
+            # Ensure the non-orjson fallback writes compatible files.
+            with mock.patch.object(email, "orjson", None):
+                original.save_to_file(state_file)
+            self.assertEqual(email.ScriptState.load_from_file(state_file), original)
+
+    def test_scriptstate_json_roundtrip(self) -> None:
+        original = email.ScriptState(
+            seen_advisories=["a", "b"],
+            last_alert_about_rotation=123.45,
+            advisory_list_etags={"draft": '"etag"'},
+        )
         as_json = original.to_json()
         reconstructed = email.ScriptState.from_json(as_json)
         self.assertEqual(original, reconstructed)
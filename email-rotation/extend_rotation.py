@@ -1,9 +1,10 @@
 #!/usr/bin/env python3
 
 import argparse
-import collections
 import dataclasses
 import datetime
+import heapq
+import itertools
 import logging
 from pathlib import Path
 from typing import Iterator
@@ -46,13 +47,14 @@ def generate_additional_rotations(
     # rotations are very infrequent anyway. If it's a problem, we can figure out
     # something better.
     last_service_times = find_most_recent_service_times(prior_rotations, members)
-    least_recent_assignees = collections.deque(
-        name
-        for name, _ in sorted(
-            last_service_times.items(),
-            key=lambda item: item[1],
-        )
-    )
+    # A heap of (last service time, tiebreaker, name). The tiebreaker keeps
+    # ordering stable: ties go to whoever was added to the heap first.
+    tiebreaker = itertools.count()
+    least_recent_assignees = [
+        (service_time, next(tiebreaker), name)
+        for name, service_time in last_service_times.items()
+    ]
+    heapq.heapify(least_recent_assignees)
 
     rotation_length = datetime.timedelta(weeks=rotation_length_weeks)
     if prior_rotations:
@@ -67,14 +69,19 @@ def generate_additional_rotations(
     while True:
         people_on_this_rotation = []
         for _ in range(people_per_rotation):
-            people_on_this_rotation.append(least_recent_assignees.popleft())
+            _, _, name = heapq.heappop(least_recent_assignees)
+            people_on_this_rotation.append(name)
 
         yield rotations.Rotation(
             start_time=next_rotation_start_time,
             members=people_on_this_rotation,
         )
+        for name in people_on_this_rotation:
+            heapq.heappush(
+                least_recent_assignees,
+                (next_rotation_start_time, next(tiebreaker), name),
+            )
         next_rotation_start_time += rotation_length
-        least_recent_assignees.extend(people_on_this_rotation)
 
 
 def parse_args() -> argparse.Namespace:
@@ -142,8 +149,10 @@ def main() -> None:
     rotation_length_weeks: int = opts.rotation_length_weeks
     rotation_members_file_path: Path = opts.rotation_members_file
 
-    members_file = rotations.RotationMembersFile.parse_file(rotation_members_file_path)
-    current_rotation = rotations.RotationFile.parse_file(rotation_file_path)
+    members_file = rotations.load_cached(
+        rotations.RotationMembersFile, rotation_members_file_path
+    )
+    current_rotation = rotations.load_cached(rotations.RotationFile, rotation_file_path)
 
     rotation_generator = generate_additional_rotations(
         current_rotation.rotations,
@@ -153,7 +162,7 @@ def main() -> None:
         now=datetime.datetime.now(tz=datetime.timezone.utc),
     )
 
-    extra_rotations = [x for x, _ in zip(rotation_generator, range(num_rotations))]
+    extra_rotations = list(itertools.islice(rotation_generator, num_rotations))
     new_rotations = current_rotation.rotations + extra_rotations
     new_rotations_file = dataclasses.replace(current_rotation, rotations=new_rotations)
 
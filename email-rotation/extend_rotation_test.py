@@ -62,6 +62,40 @@ class TestFindMostRecentServiceTimes(unittest.TestCase):
         }
         self.assertEqual(result, expected)
 
+    def test_former_members_keep_first_appearance_order(self) -> None:
+        time1 = datetime.datetime(2023, 1, 1, tzinfo=datetime.timezone.utc)
+        time2 = datetime.datetime(2023, 1, 15, tzinfo=datetime.timezone.utc)
+        time3 = datetime.datetime(2023, 2, 1, tzinfo=datetime.timezone.utc)
+        time4 = datetime.datetime(2023, 2, 15, tzinfo=datetime.timezone.utc)
+        # Only p1 and p4 are still members; everyone else has left.
+        prior_rotations = [
+            Rotation(start_time=time1, members=["p0", "p4", "p2"]),
+            Rotation(start_time=time2, members=["p2"]),
+            Rotation(start_time=time3, members=["p0", "p3"]),
+            Rotation(start_time=time4, members=["p1", "p4"]),
+            Rotation(start_time=time4, members=["p3", "p2", "f0"]),
+        ]
+        result = find_most_recent_service_times(prior_rotations, ["p1", "p4"])
+        # Former members come after current ones, in order of first
+        # appearance, since ties are broken by this order.
+        self.assertEqual(
+            list(result.items()),
+            [
+                ("p1", time4),
+                ("p4", time4),
+                ("p0", time3),
+                ("p2", time4),
+                ("p3", time4),
+                ("f0", time4),
+            ],
+        )
+
+        generator = generate_additional_rotations(
+            prior_rotations, ["p1", "p4"], 2, 2, now=MOCKED_NOW_UTC
+        )
+        generated_list = [next(generator).members for _ in range(3)]
+        self.assertEqual(generated_list, [["p0", "p1"], ["p4", "p2"], ["p3", "f0"]])
+
 
 class TestGenerateAdditionalRotations(unittest.TestCase):
     def test_generate_no_prior_rotations(self) -> None:
@@ -4,13 +4,16 @@ import dataclasses
 import datetime
 import logging
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple, Type, TypeVar
 
 import yaml
 
 ROTATION_FILE = Path(__file__).resolve().parent / "rotation.yaml"
 ROTATION_MEMBERS_FILE = Path(__file__).resolve().parent / "rotation-members.yaml"
 
+# Prefer libyaml's (much faster) loader, if PyYAML was built with it.
+YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 @dataclasses.dataclass(frozen=True)
 class RotationMembersFile:
@@ -31,8 +34,8 @@ class RotationMembersFile:
     def parse_file(cls, filepath: Path) -> "RotationMembersFile":
         """Load the rotation members from a YAML file."""
         try:
-            with filepath.open(encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+            with filepath.open("rb") as f:
+                data = yaml.load(f, Loader=YamlLoader)
                 return cls.from_yaml(data)
         except FileNotFoundError:
             logging.warning(
@@ -47,6 +50,11 @@ class Rotation:
 
     start_time: datetime.datetime
     members: List[str]
+    # `start_time.timestamp()`, which is surprisingly slow to compute.
+    start_timestamp: float = dataclasses.field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "start_timestamp", self.start_time.timestamp())
 
     @classmethod
     def from_yaml(cls, data: Dict[str, Any]) -> "Rotation":
@@ -56,9 +64,10 @@ class Rotation:
 
     def to_yaml(self) -> Dict[str, Any]:
         """Convert the instance to a YAML-compatible dictionary."""
-        as_dict = dataclasses.asdict(self)
-        as_dict["start_time"] = self.start_time.isoformat()
-        return as_dict
+        return {
+            "members": list(self.members),
+            "start_time": self.start_time.isoformat(),
+        }
 
 
 ROTATION_FILE_TOP_COMMENT = """\
@@ -98,11 +107,41 @@ class RotationFile:
     def parse_file(cls, filepath: Path) -> "RotationFile":
         """Load the rotation from a YAML file."""
         try:
-            with filepath.open(encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+            with filepath.open("rb") as f:
+                data = yaml.load(f, Loader=YamlLoader)
                 return cls.from_yaml(data)
         except FileNotFoundError:
             logging.warning(
                 f"file '%s' not found. Using empty rotation file.", filepath
             )
             return cls(rotations=[])
+
+
+_ParsedFileT = TypeVar("_ParsedFileT", RotationMembersFile, RotationFile)
+
+# Maps (file type, resolved path) -> (st_mtime_ns, parsed file).
+_parsed_file_cache: Dict[Tuple[type, Path], Tuple[int, Any]] = {}
+
+
+def load_cached(cls: Type[_ParsedFileT], filepath: Path) -> _ParsedFileT:
+    """Like `cls.parse_file(filepath)`, but reuses the parsed result if the
+    file hasn't been modified since it was last parsed."""
+    try:
+        mtime_ns = filepath.stat().st_mtime_ns
+    except FileNotFoundError:
+        return cls.parse_file(filepath)
+
+    key = (cls, filepath.resolve())
+    cached = _parsed_file_cache.get(key)
+    if cached and cached[0] == mtime_ns:
+        result: _ParsedFileT = cached[1]
+        return result
+
+    result = cls.parse_file(filepath)
+    _parsed_file_cache[key] = (mtime_ns, result)
+    return result
+
+
+def clear_parse_cache() -> None:
+    """Forgets all files parsed by `load_cached`."""
+    _parsed_file_cache.clear()
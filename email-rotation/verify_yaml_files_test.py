@@ -1,6 +1,10 @@
 #!/usr/bin/env python3
 
+import os
+import shutil
+import tempfile
 import unittest
+from pathlib import Path
 
 import rotations
 
@@ -8,6 +12,9 @@ import rotations
 class TestRotationYamlFilesParse(unittest.TestCase):
     """Ensures our yaml files parse."""
 
+    def setUp(self) -> None:
+        rotations.clear_parse_cache()
+
     def test_rotation_members_yaml_parses(self) -> None:
         parsed = rotations.RotationMembersFile.parse_file(
             rotations.ROTATION_MEMBERS_FILE
@@ -18,6 +25,26 @@ class TestRotationYamlFilesParse(unittest.TestCase):
         parsed = rotations.RotationFile.parse_file(rotations.ROTATION_FILE)
         self.assertTrue(parsed.rotations, "No rotations could be parsed")
 
+    def test_load_cached_reuses_parsed_files(self) -> None:
+        first = rotations.load_cached(rotations.RotationFile, rotations.ROTATION_FILE)
+        second = rotations.load_cached(rotations.RotationFile, rotations.ROTATION_FILE)
+        self.assertIs(first, second)
+        self.assertEqual(
+            first, rotations.RotationFile.parse_file(rotations.ROTATION_FILE)
+        )
+
+    def test_load_cached_reparses_modified_files(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            rotation_file = Path(tmp_dir) / "rotation.yaml"
+            shutil.copy(rotations.ROTATION_FILE, rotation_file)
+            first = rotations.load_cached(rotations.RotationFile, rotation_file)
+
+            stat = rotation_file.stat()
+            os.utime(rotation_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+            second = rotations.load_cached(rotations.RotationFile, rotation_file)
+            self.assertIsNot(first, second)
+            self.assertEqual(first, second)
+
 
 if __name__ == "__main__":
     unittest.main()